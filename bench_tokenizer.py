@@ -0,0 +1,54 @@
+import random
+import re
+import time
+from models import Sentence
+from tokenizer import TokenCache, tokenize_many, words
+
+_LEGACY_RE = r"\w+['’]?\w*|\S"
+
+def make_corpus(n_sentences: int, seed: int = 0):
+    rng = random.Random(seed)
+    eng_vocab = ["Abebe", "is", "a", "man", "woman", "boy", "girl", "and", "the", "family",
+                 "don't", "it's", "house", "12", "3.5", ",", ".", "?", "!"]
+    amh_vocab = ["አቶ", "አበበ", "ወንድ", "ነው", "ወ/ሮ", "አበባ", "ሴት", "ናት", "እና", "ልጅ",
+                 "፲፪", "12", "፣", "፤", "።"]
+    corpus = []
+    for i in range(n_sentences):
+        english = " ".join(rng.choice(eng_vocab) for _ in range(rng.randint(4, 16)))
+        amharic = "".join(rng.choice(amh_vocab) + rng.choice(["", " "]) for _ in range(rng.randint(4, 16)))
+        corpus.append(Sentence(id=i, english=english, amharic=amharic, alignment=[]))
+    return corpus
+
+def benchmark(n_sentences: int = 50000, seed: int = 0):
+    corpus = make_corpus(n_sentences, seed)
+    n_chars = sum(len(s.english) + len(s.amharic) for s in corpus)
+
+    def run(label, fn):
+        t0 = time.perf_counter()
+        n_tokens = fn()
+        dt = time.perf_counter() - t0
+        print(f"{label:<30} {dt:8.3f}s  {n_sentences / dt:12,.0f} sent/s  "
+              f"{n_chars / dt / 1e6:6.2f} Mchar/s  {n_tokens:,} tokens")
+
+    def legacy():
+        # the old utils.split_words, keeping its results like the cache does
+        result = {s.id: (re.findall(_LEGACY_RE, s.english), re.findall(_LEGACY_RE, s.amharic))
+                  for s in corpus}
+        return sum(len(e) + len(a) for e, a in result.values())
+
+    def split_words():
+        result = {s.id: (words(s.english, "en"), words(s.amharic, "am")) for s in corpus}
+        return sum(len(e) + len(a) for e, a in result.values())
+
+    def count(result):
+        return sum(len(t.english) + len(t.amharic) for t in result.values())
+
+    cache = TokenCache()
+    print(f"{n_sentences:,} synthetic sentences, {n_chars:,} chars")
+    run("legacy split_words", legacy)
+    run("words (strings only)", split_words)
+    run("tokenize_many (cold)", lambda: count(tokenize_many(corpus, cache)))
+    run("tokenize_many (cached)", lambda: count(tokenize_many(corpus, cache)))
+
+if __name__ == "__main__":
+    benchmark()
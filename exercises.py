@@ -1,4 +1,5 @@
 import random
+from tokenizer import tokenize
 
 def generate_matching(vocab_list):
     
@@ -11,10 +12,25 @@ def generate_matching(vocab_list):
 
 def generate_fill_blank(sentence, target_word):
     
-    lower = sentence.lower()
-    tgt_lower = target_word.lower()
-    if tgt_lower in lower:
-        blanked = sentence.replace(target_word, "_____")
-    else:
-        blanked = sentence
-    return blanked
+    tokens = tokenize(sentence)
+    target = tokenize(target_word)
+    if not target:
+        return sentence
+    texts = [t.text.lower() for t in target]
+    gaps = [target_word[a.end:b.start] for a, b in zip(target, target[1:])]
+    n = len(target)
+    parts = []
+    last = 0
+    i = 0
+    while i <= len(tokens) - n:
+        run = tokens[i:i + n]
+        if ([t.text.lower() for t in run] == texts
+                and [sentence[a.end:b.start] for a, b in zip(run, run[1:])] == gaps):
+            parts.append(sentence[last:run[0].start])
+            parts.append("_____")
+            last = run[-1].end
+            i += n
+        else:
+            i += 1
+    parts.append(sentence[last:])
+    return "".join(parts)
@@ -0,0 +1,62 @@
+import pytest
+from exercises import generate_fill_blank
+from models import Sentence
+from tokenizer import Token, TokenCache, tokenize, tokenize_many, tokenize_sentence, words
+
+def test_tokenize_offsets_and_kinds():
+    assert tokenize("Mr. Abebe has 3.5 cows") == [
+        Token("Mr", 0, 2, "word"),
+        Token(".", 2, 3, "punct"),
+        Token("Abebe", 4, 9, "word"),
+        Token("has", 10, 13, "word"),
+        Token("3.5", 14, 17, "number"),
+        Token("cows", 18, 22, "word"),
+    ]
+
+def test_contractions_stay_whole():
+    assert words("Don't go, it’s late.") == ["Don't", "go", ",", "it’s", "late", "."]
+
+def test_number_glued_to_letters_is_not_split_as_number():
+    tokens = tokenize("1.5x")
+    assert [t.text for t in tokens] == ["1", ".", "5x"]
+    assert all(t.kind != "number" for t in tokens)
+
+def test_ethiopic_punctuation():
+    assert words("ካሌብ፣ሳሙኤል፤ አበበ ወንድ ነው።", "am") == ["ካሌብ", "፣", "ሳሙኤል", "፤", "አበበ", "ወንድ", "ነው", "።"]
+    assert [t.kind for t in tokenize("ነው።", "am")] == ["word", "punct"]
+
+def test_ethiopic_abbreviation_is_one_token():
+    assert words("ወ/ሮ አበባ ሴት ናት።", "am") == ["ወ/ሮ", "አበባ", "ሴት", "ናት", "።"]
+
+def test_ethiopic_numerals():
+    assert [(t.text, t.kind) for t in tokenize("፲፪ ልጅ", "am")] == [("፲፪", "number"), ("ልጅ", "word")]
+
+def test_words_matches_tokenize():
+    for text, lang in [("Kaleb is a boy, and 12 is a number.", "en"), ("ወ/ሮ አበባ፣ 12 abc።", "am")]:
+        assert words(text, lang) == [t.text for t in tokenize(text, lang)]
+
+def test_unsupported_language():
+    with pytest.raises(ValueError):
+        tokenize("hello", "fr")
+
+def test_tokenize_many_fills_cache():
+    cache = TokenCache()
+    s = Sentence(id=1, english="A man.", amharic="ወንድ ነው።", alignment=[])
+    result = tokenize_many([s], cache)
+    assert len(cache) == 1
+    assert tokenize_sentence(s, cache) is result[1]
+    s.english = "A woman."
+    assert [t.text for t in tokenize_sentence(s, cache).english] == ["A", "woman", "."]
+
+def test_fill_blank_whole_word_case_insensitive():
+    assert generate_fill_blank("The man is a Man. Manners, a man!", "man") == "The _____ is a _____. Manners, a _____!"
+
+def test_fill_blank_multi_word():
+    assert generate_fill_blank("Mr. Abebe is a man.", "a man") == "Mr. Abebe is _____."
+
+def test_fill_blank_respects_gaps():
+    assert generate_fill_blank("Mr. Abebe and Mr . Kebede", "Mr.") == "_____ Abebe and Mr . Kebede"
+
+def test_fill_blank_no_match():
+    assert generate_fill_blank("Mrs. Abeba is a woman", "man") == "Mrs. Abeba is a woman"
+    assert generate_fill_blank("Hello", "") == "Hello"
@@ -0,0 +1,109 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+# Ethiopic syllables (base block, supplement, extended, extended-A) plus the
+# combining marks that may follow them.
+_ETHIOPIC_LETTERS = "\u1200-\u135A\u135D-\u135F\u1380-\u138F\u2D80-\u2DDE\uAB01-\uAB2E"
+_ETHIOPIC_NUMERALS = "\u1369-\u137C"
+# ፠ ፡ ። ፣ ፤ ፥ ፦ ፧ ፨
+_ETHIOPIC_PUNCT = "\u1360-\u1368"
+
+# A number must be the whole run of digits: if a letter or another digit group
+# follows, it is left to the word alternative instead of being cut short.
+_NUMBER = r"\d+(?:[.,]\d+)*(?![.,]?\w)"
+_LATIN_WORD = r"\w+(?:['’]\w+)*"
+
+_ENGLISH = [
+    ("number", _NUMBER),
+    ("word", _LATIN_WORD),
+    ("punct", r"\S"),
+]
+
+# Abbreviations such as ወ/ሮ are written with a slash and stay one token.
+_AMHARIC = [
+    ("word", rf"[{_ETHIOPIC_LETTERS}]+(?:/[{_ETHIOPIC_LETTERS}]+)*"),
+    ("number", rf"[{_ETHIOPIC_NUMERALS}]+|{_NUMBER}"),
+    ("punct", rf"[{_ETHIOPIC_PUNCT}]"),
+    ("latin", _LATIN_WORD),
+    ("other", r"\S"),
+]
+
+def _compile(alternatives, named):
+    if named:
+        return re.compile("|".join(f"(?P<{kind}>{p})" for kind, p in alternatives))
+    return re.compile("|".join(f"(?:{p})" for _, p in alternatives))
+
+# Named groups give each token its kind; the plain patterns let words() use findall.
+_PATTERNS = {"en": _compile(_ENGLISH, True), "am": _compile(_AMHARIC, True)}
+_WORD_PATTERNS = {"en": _compile(_ENGLISH, False), "am": _compile(_AMHARIC, False)}
+_KINDS = {"latin": "word", "other": "punct"}
+
+class Token(NamedTuple):
+    text: str
+    start: int
+    end: int
+    kind: str
+
+@dataclass
+class SentenceTokens:
+    english: List[Token]
+    amharic: List[Token]
+
+def tokenize(text: str, lang: str = "en") -> List[Token]:
+    """Split text into word, number and punctuation tokens with their offsets."""
+    try:
+        pattern = _PATTERNS[lang]
+    except KeyError:
+        raise ValueError(f"unsupported language: {lang}")
+    kinds = _KINDS
+    return [Token(m.group(), m.start(), m.end(), kinds.get(m.lastgroup, m.lastgroup))
+            for m in pattern.finditer(text)]
+
+def words(text: str, lang: str = "en") -> List[str]:
+    """Token texts only, without building Token objects."""
+    try:
+        pattern = _WORD_PATTERNS[lang]
+    except KeyError:
+        raise ValueError(f"unsupported language: {lang}")
+    return pattern.findall(text)
+
+class TokenCache:
+    """Tokens per sentence id; an entry is dropped when the sentence text changes."""
+
+    def __init__(self):
+        self._entries = {}
+
+    def get(self, sentence) -> Optional[SentenceTokens]:
+        entry = self._entries.get(sentence.id)
+        if entry is None:
+            return None
+        english, amharic, tokens = entry
+        if english != sentence.english or amharic != sentence.amharic:
+            del self._entries[sentence.id]
+            return None
+        return tokens
+
+    def put(self, sentence, tokens: SentenceTokens):
+        self._entries[sentence.id] = (sentence.english, sentence.amharic, tokens)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+_cache = TokenCache()
+
+def tokenize_sentence(sentence, cache: Optional[TokenCache] = None) -> SentenceTokens:
+    cache = _cache if cache is None else cache
+    tokens = cache.get(sentence)
+    if tokens is None:
+        tokens = SentenceTokens(tokenize(sentence.english, "en"), tokenize(sentence.amharic, "am"))
+        cache.put(sentence, tokens)
+    return tokens
+
+def tokenize_many(sentences: Iterable, cache: Optional[TokenCache] = None) -> Dict[int, SentenceTokens]:
+    """Tokenize a whole lesson pack at once, filling the cache as it goes."""
+    cache = _cache if cache is None else cache
+    return {s.id: tokenize_sentence(s, cache) for s in sentences}
@@ -3,7 +3,8 @@ from tkinter import ttk, messagebox, simpledialog
 import json
 import os
 from db import save_user, get_user, update_profile, save_progress, load_progress, cache_lessons, load_cached_lesson
-from utils import hash_password, split_words, escape
+from utils import hash_password, escape
+from tokenizer import tokenize_many, tokenize_sentence
 from tts_engine import TTSEngine
 from nlp_engine import tokenize_and_tag
 from exercises import generate_matching, generate_fill_blank
@@ -37,6 +38,7 @@ class AppUI:
                 sentences.append(Sentence(id=s["id"], english=s["english"], amharic=s["amharic"], alignment=s.get("alignment", []), notes=s.get("notes", "")))
             lessons.append(Lesson(id=l["id"], title=l["title"], level=l.get("level", "Beginner"), sentences=sentences, vocabulary=l.get("vocabulary", [])))
             cache_lessons(l["id"], l)
+        tokenize_many(s for l in lessons for s in l.sentences)
         return lessons
 
     def setup_ui(self):
@@ -189,7 +191,8 @@ class AppUI:
         self.eng_text.delete("1.0", tk.END)
         self.amh_text.delete("1.0", tk.END)
 
-        eng_words = split_words(s.english)
+        tokens = tokenize_sentence(s)
+        eng_words = [t.text for t in tokens.english]
         for i, w in enumerate(eng_words):
             tag = f"eng_{i}"
             start_index = self.eng_text.index(tk.INSERT)
@@ -209,7 +212,7 @@ class AppUI:
                 self.amh_text.tag_bind(tag, "<Button-1>", lambda e, idx=i: self.on_amh_click(idx))
                 self.amh_text.tag_config(tag, underline=True)
         else:
-            amh_words = split_words(s.amharic)
+            amh_words = [t.text for t in tokens.amharic]
             for i, w in enumerate(amh_words):
                 start_index = self.amh_text.index(tk.INSERT)
                 self.amh_text.insert(tk.END, w + " ")
@@ -369,7 +372,7 @@ class AppUI:
         if self.selected_lesson.vocabulary:
             target = random.choice(self.selected_lesson.vocabulary)['word']
         else:
-            target = sent.english.split()[0]
+            target = next((t.text for t in tokenize_sentence(sent).english if t.kind == "word"), sent.english)
         blanked = generate_fill_blank(sent.english, target)
         ttk.Label(frame2, text=f"{blanked}").pack(padx=6, pady=6)
         ans_entry = ttk.Entry(frame2)
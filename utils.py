@@ -1,6 +1,7 @@
 import hashlib
 import html
 from typing import List
+from tokenizer import words
 
 def hash_password(password: str) -> str:
     salt = "nl_secure_salt_v1"
@@ -9,7 +10,5 @@ def hash_password(password: str) -> str:
 def escape(s: str) -> str:
     return html.escape(s)
 
-def split_words(sentence: str) -> List[str]:
-    import re
-    words = re.findall(r"\w+['’]?\w*|\S", sentence)
-    return words
+def split_words(sentence: str, lang: str = "en") -> List[str]:
+    return words(sentence, lang)